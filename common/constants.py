@@ -9,7 +9,7 @@ except ImportError:
     # 3rd-party
     import Mock.GPIO as GPIO
 
-AVAILABLE_RPI_GPIO_PINS = [
+AVAILABLE_RPI_GPIO_PINS = (
     (2, "GPIO 2 - Pin 3"),
     (3, "GPIO 3 - Pin 5"),
     (4, "GPIO 4 - Pin 7"),
@@ -38,7 +38,7 @@ AVAILABLE_RPI_GPIO_PINS = [
     (26, "GPIO 26 - Pin 37"),
     (20, "GPIO 20 - Pin 38"),
     (21, "GPIO 21 - Pin 40"),
-]
+)
 
 # These are all the models that use GPIO pins.
 # Used to check each pin is only used once.
@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
 """Core code used across multiple apps."""
+# Standard Library
+from functools import lru_cache
+
 # Django
 from django.apps import apps
 from django.core.exceptions import ValidationError
@@ -10,70 +13,120 @@ from common.constants import GPIO_PIN_USING_MODELS
 from common.exceptions import ImplementationError
 
 
+@lru_cache(maxsize=None)
+def get_gpio_pin_using_model(modelstr):
+    """
+    Resolve a GPIO_PIN_USING_MODELS entry to its model class and GPIO pin fields.
+
+    Returns a (model, gpio_pin_fields) tuple, or None if the app is not installed.
+    Results are cached for the life of the process, as neither can change at runtime.
+    """
+    try:
+        app, model = modelstr.split(".")
+    except (IndexError, ValueError):
+        raise ImplementationError(
+            f"The format for defining models is '<app_name>.<model_name>'"
+            f", you defined {modelstr}.",
+        )
+
+    try:
+        model_class = apps.get_model(app_label=app, model_name=model)
+    except LookupError:
+        # App is not installed in parent app.
+        return None
+    return model_class, model_class.gpio_pin_fields
+
+
 def check_for_GPIO_pin_use_in_this_instance(instance):
     """
     Validate that the selected GPIO pins have not been selected twice in this instance.
 
-    Requires instance to be a model with the gpio_pin_fields attribute set.
+    Requires instance to be a model with the gpio_pin_fields class attribute set.
     Raises ValidationErrors.
     Should be called before save, preferably in the clean method of a model.
     """
-    # Check for already assigned GPIO pins in this instance.
+    # Check for already assigned GPIO pins in this instance, in a single pass.
+    seen_pins = {}
     for gpio_field in instance.gpio_pin_fields:
-        for other_field in instance.gpio_pin_fields:
-            if gpio_field == other_field:
-                continue
-            if not getattr(instance, gpio_field):
-                continue
-            if getattr(instance, gpio_field) == getattr(instance, other_field):
-                raise ValidationError(
-                    {
-                        gpio_field: f"This GPIO pin is used in this motor for "
-                        f"{other_field}, GPIO pins must be unique.",
-                    },
-                )
+        value = getattr(instance, gpio_field)
+        if not value:
+            continue
+        if value in seen_pins:
+            raise ValidationError(
+                {
+                    gpio_field: f"This GPIO pin is used in this motor for "
+                    f"{seen_pins[value]}, GPIO pins must be unique.",
+                },
+            )
+        seen_pins[value] = gpio_field
 
 
 def check_for_GPIO_pin_use_in_this_and_other_models(instance):
     """
     Validates that hte GPIO pins selected for this model are not used elsewhere.
 
-    Requires instance to be a model with the gpio_pin_fields attribute set.
-    Checks all models in constants.GPIO_PIN_USING_MODELS.
+    Requires instance to be a model with the gpio_pin_fields class attribute set.
+    Checks all models in constants.GPIO_PIN_USING_MODELS, with one query per model.
     Raises ValidationErrors.
     Should be called before save, preferably in the clean method of a model.
     """
-    this_instance_pins_used = [getattr(instance, x) for x in instance.gpio_pin_fields]
-    this_instance_pins_used = [x for x in this_instance_pins_used if x]
-
+    # Map each used pin back to the field it is set on, for error reporting.
+    this_instance_pins_used = {}
     for pin_field in instance.gpio_pin_fields:
-        for modelstr in GPIO_PIN_USING_MODELS:
-            try:
-                app, model = modelstr.split(".")
-            except (IndexError, ValueError):
-                raise ImplementationError(
-                    f"The format for defining models is '<app_name>.<model_name>'"
-                    f", you defined {modelstr}.",
-                )
-
-            try:
-                model_to_search = apps.get_model(app_label=app, model_name=model)
-            except LookupError:
-                # App is not installed in parent app.
-                continue
-            filters = Q()
-            for spec_field in model_to_search().gpio_pin_fields:
-                for value in this_instance_pins_used:
-                    filters.add(Q(**{spec_field: value}), Q.OR)
-
-            filtered_results = model_to_search.objects.filter(filters)
-            if instance.pk:
-                filtered_results = filtered_results.exclude(pk=instance.pk)
-            if filtered_results.count() > 0:
-                raise ValidationError(
-                    {
-                        pin_field: f"This GPIO pin is already in use on "
-                        f"{filtered_results[0].name}, please select "
-                        f"another.",
-                    },
-                )
+        value = getattr(instance, pin_field)
+        if value:
+            # Key on the value as the DB returns it, pins set as strings are saved as ints.
+            value = instance._meta.get_field(pin_field).to_python(value)
+            this_instance_pins_used[value] = pin_field
+    if not this_instance_pins_used:
+        # Nothing to clash with.
+        return
+    pin_values = tuple(this_instance_pins_used)
+
+    for modelstr in GPIO_PIN_USING_MODELS:
+        resolved = get_gpio_pin_using_model(modelstr)
+        if resolved is None:
+            continue
+        model_to_search, spec_fields = resolved
+
+        # One IN clause per pin field, rather than one clause per field and pin pair.
+        filters = Q()
+        for spec_field in spec_fields:
+            filters.add(Q(**{f"{spec_field}__in": pin_values}), Q.OR)
+
+        filtered_results = model_to_search.objects.filter(filters)
+        # Only exclude the instance itself, pks are not unique across models.
+        if instance.pk and isinstance(instance, model_to_search):
+            filtered_results = filtered_results.exclude(pk=instance.pk)
+        # A plain row is all that's needed for the error, no need to build a model instance.
+        clashing_row = filtered_results.values_list("name", *spec_fields).first()
+        if clashing_row is None:
+            continue
+
+        clashing_name, *clashing_pins = clashing_row
+        for clashing_pin in clashing_pins:
+            pin_field = this_instance_pins_used.get(clashing_pin)
+            if pin_field:
+                break
+        raise ValidationError(
+            {
+                pin_field: f"This GPIO pin is already in use on "
+                f"{clashing_name}, please select "
+                f"another.",
+            },
+        )
+
+
+def check_for_GPIO_pin_use(instance):
+    """
+    Validate that the selected GPIO pins are not used twice, here or anywhere else.
+
+    The single entry point for GPIO pin validation in model clean methods.
+    Requires instance to be a model with the gpio_pin_fields class attribute set.
+    Raises ValidationErrors.
+    """
+    check_for_GPIO_pin_use_in_this_instance(instance)
+    # Always search the other models, even if this instance's pins haven't changed since it
+    # was loaded. Rows saved without clean, e.g. by bulk_create, update() or loaddata, can
+    # have taken one of its pins since.
+    check_for_GPIO_pin_use_in_this_and_other_models(instance)
@@ -2,9 +2,36 @@
 """Admin."""
 
 # Django
-from django.contrib import admin  # noqa: F401
+from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 
 # Project
 from motor_controller.models import StepperMotor
 
-admin.site.register(StepperMotor)
+
+class StepperMotorChangeList(ChangeList):
+    """Changelist for stepper motors, which doesn't fetch descriptions to list them."""
+
+    def get_queryset(self, request):
+        """Defer descriptions, but only when listing, not for actions."""
+        queryset = super().get_queryset(request)
+        # Actions such as delete_selected are POSTed with this queryset and render each
+        # motor's __str__, which reads the description.
+        if request.method == "GET":
+            queryset = queryset.defer("description")
+        return queryset
+
+
+@admin.register(StepperMotor)
+class StepperMotorAdmin(admin.ModelAdmin):
+    """Admin for stepper motors."""
+
+    list_display = ("name", "driver_type")
+
+    def get_changelist(self, request, **kwargs):
+        """The changelist doesn't show descriptions, so don't fetch them."""
+        return StepperMotorChangeList
+
+    def save_model(self, request, obj, form, change):
+        """The admin form has already cleaned the instance, so don't clean it again."""
+        obj.save(skip_clean=True)
@@ -4,7 +4,16 @@
 # Django
 from django.apps import AppConfig
 
+# Project
+from common.constants import GPIO_PIN_USING_MODELS
+from common.utils import get_gpio_pin_using_model
+
 
 class NemaStepperControllerConfig(AppConfig):  # noqa: D101
     default_auto_field = "django.db.models.BigAutoField"
     name = "motor_controller"
+
+    def ready(self):
+        """Resolve the GPIO pin using models up front, so validation never has to."""
+        for modelstr in GPIO_PIN_USING_MODELS:
+            get_gpio_pin_using_model(modelstr)
@@ -1,11 +1,41 @@
 # -*- coding: utf-8 -*-
 """Constants for motor controller."""
 
+# Standard Library
+from enum import IntEnum
+
 # 3rd-party
 from RpiMotorLib.RpiMotorLib import A4988Nema
 
-STEPPER_DRIVER_TYPES = [
-    # [stepper_type_name, rpimsotorlib_driver_class]
+STEPPER_DRIVER_TYPES = (
+    # (stepper_type_name, rpimsotorlib_driver_class)
     # Add to this as support comes online.
-    ["A4988", A4988Nema],
-]
+    ("A4988", A4988Nema),
+)
+
+# {stepper_type_name: rpimotorlib_driver_class}, for constant time lookups.
+STEPPER_DRIVER_MAP = {driver[0]: driver[1] for driver in STEPPER_DRIVER_TYPES}
+
+# Model field choices for STEPPER_DRIVER_TYPES, built once and shared.
+STEPPER_DRIVER_CHOICES = tuple((driver[0], driver[0]) for driver in STEPPER_DRIVER_TYPES)
+
+# StepperMotor methods the move view may call, by name.
+STEPPER_MOVEMENT_TYPES = ("move_mm", "move_steps", "move_rotations")
+
+# {steptype: microsteps per full step}, in order of increasing resolution.
+STEPTYPE_MULTIPLIERS = {"Full": 1, "Half": 2, "1/4": 4, "1/8": 8, "1/16": 16}
+
+
+class DirectionOfRotation(IntEnum):
+    """Directions of rotation, valued as the clockwise flag RpiMotorLib drivers expect."""
+
+    ANTI_CLOCKWISE = 0
+    CLOCKWISE = 1
+
+
+# {direction_of_rotation_label: DirectionOfRotation}, and its reverse.
+DIRECTIONS_OF_ROTATION = {
+    "clockwise": DirectionOfRotation.CLOCKWISE,
+    "anti-clockwise": DirectionOfRotation.ANTI_CLOCKWISE,
+}
+DIRECTION_OF_ROTATION_LABELS = {value: key for key, value in DIRECTIONS_OF_ROTATION.items()}
@@ -3,6 +3,7 @@
 
 # Standard Library
 import logging
+from typing import NamedTuple
 
 # Django
 from django.core.exceptions import ValidationError
@@ -16,11 +17,26 @@ from common.constants import AVAILABLE_RPI_GPIO_PINS
 from common.exceptions import CommandError
 from common.exceptions import ConfigurationError
 from common.exceptions import ImplementationError
-from common.utils import check_for_GPIO_pin_use_in_this_and_other_models
-from common.utils import check_for_GPIO_pin_use_in_this_instance
+from common.utils import check_for_GPIO_pin_use
 
 # Local
-from .constants import STEPPER_DRIVER_TYPES
+from .constants import DIRECTION_OF_ROTATION_LABELS
+from .constants import DIRECTIONS_OF_ROTATION
+from .constants import STEPPER_DRIVER_CHOICES
+from .constants import STEPPER_DRIVER_MAP
+from .constants import STEPTYPE_MULTIPLIERS
+from .constants import DirectionOfRotation
+
+logger = logging.getLogger(__name__)
+
+
+class MotorCommand(NamedTuple):
+    """A single queued stepper move, as taken by StepperMotor.move_steps_batch."""
+
+    direction_of_rotation: str
+    steptype: str
+    steps: int
+    step_delay: float
 
 
 class Motor(models.Model):
@@ -29,41 +45,34 @@ class Motor(models.Model):
     name = models.CharField(max_length=200, verbose_name="Human Name")
     description = models.TextField(null=True, blank=True)
 
-    @property
-    def gpio_pin_fields(self):
-        """
-        Return the fields of this model that contain GPIO info.
-
-        This project is only designed to work with one RPi at a time, so pins can only
-        be used once.
-        Allows for checking of used GPIO pins across all motors.
-        """
-        raise NotImplementedError("This needs to be set by the concrete subclass.")
+    # The fields of this model that contain GPIO info, set by the concrete subclass.
+    # This project is only designed to work with one RPi at a time, so pins can only
+    # be used once. Allows for checking of used GPIO pins across all motors.
+    gpio_pin_fields = None
 
     def clean(self):
         """Generic model clean functions for all Motor objects."""  # noqa: D401
         super(Motor, self).clean()
-        check_for_GPIO_pin_use_in_this_instance(self)
-        check_for_GPIO_pin_use_in_this_and_other_models(self)
+        if self.gpio_pin_fields is None:
+            raise NotImplementedError("This needs to be set by the concrete subclass.")
+        check_for_GPIO_pin_use(self)
 
 
 class StepperMotor(Motor):
     """Stepper motor object, with control API functionality built-in."""
 
-    def __init__(self, *args, **kwargs):  # noqa: D107
-        super().__init__(*args, **kwargs)
-        self._direction_of_rotation = True
-        self._steptype = "Full"
-        self._verbose = False  # not sure what this is yet.
-        if self.driver_type:
-            self.controller_class = self.get_controller_class()
-        else:
-            self.controller_class = None
-        self._controller = None  # Don't init this unless we're going to use it.
+    # Modal state defaults. Kept at class level so rows loaded from the DB don't pay
+    # for setting them, setters shadow them on the instance when they change.
+    _direction_of_rotation = DirectionOfRotation.CLOCKWISE
+    _steptype = "Full"
+    _verbose = False  # not sure what this is yet.
+    _controller_class = None  # Resolved on first use, see controller_class.
+    _controller = None  # Don't init this unless we're going to use it.
+    _command_queue = None  # Created on first enqueue.
 
     driver_type = models.CharField(
         verbose_name="Motor Driver type",
-        choices=[(x[0], x[0]) for x in STEPPER_DRIVER_TYPES],
+        choices=STEPPER_DRIVER_CHOICES,
         max_length=250,
     )
     direction_GPIO_pin = models.IntegerField(
@@ -96,16 +105,14 @@ class StepperMotor(Motor):
     _step_delay = models.FloatField(help_text="Delay between steps (seconds)", default=0.01)
     _init_delay = models.FloatField(help_text="Delay before first step (seconds)", default=0.01)
 
-    @property
-    def gpio_pin_fields(self):
-        """All fields housing GPIO pin config in this model."""
-        return [
-            "direction_GPIO_pin",
-            "step_GPIO_pin",
-            "MS1_GPIO_pin",
-            "MS2_GPIO_pin",
-            "MS3_GPIO_pin",
-        ]
+    # All fields housing GPIO pin config in this model.
+    gpio_pin_fields = (
+        "direction_GPIO_pin",
+        "step_GPIO_pin",
+        "MS1_GPIO_pin",
+        "MS2_GPIO_pin",
+        "MS3_GPIO_pin",
+    )
 
     def clean(self):
         """Custom model validation for steppers."""  # noqa: D401
@@ -135,12 +142,26 @@ class StepperMotor(Motor):
                 "This class does not have a driver set yet. Save the model first.",
             )
 
-        for driver in STEPPER_DRIVER_TYPES:
-            if self.driver_type == driver[0]:
-                try:
-                    return driver[1]
-                except IndexError:
-                    raise ImplementationError("Driver class not set for driver.")
+        try:
+            return STEPPER_DRIVER_MAP[self.driver_type]
+        except KeyError:
+            raise ImplementationError("Driver class not set for driver.")
+
+    @property
+    def controller_class(self):
+        """
+        The RpiMotorLib controller class for this motor's driver type.
+
+        Resolved on first access, so instances that never move don't pay for the lookup.
+        """
+        if not self._controller_class and self.driver_type:
+            self._controller_class = self.get_controller_class()
+        return self._controller_class
+
+    @controller_class.setter
+    def controller_class(self, controller_class):
+        """Setter for the controller class."""
+        self._controller_class = controller_class
 
     def _init_controller_class(self):
         """Initialize an instance of this motors controller class."""
@@ -166,10 +187,7 @@ class StepperMotor(Motor):
 
         Take into account the current steptype.
         """
-        multipliers = [["Full", 1], ["Half", 2], ["1/4", 4], ["1/8", 8], ["1/16", 16]]
-        for opts in multipliers:
-            if self.steptype == opts[0]:
-                return self.steps_per_revolution * opts[1]
+        return self.steps_per_revolution * STEPTYPE_MULTIPLIERS[self._steptype]
 
     # Getters for modal settings
     @property
@@ -179,9 +197,7 @@ class StepperMotor(Motor):
 
         Options are "clockwise" and "anti-clockwise".
         """
-        if self._direction_of_rotation:
-            return "clockwise"
-        return "anti-clockwise"
+        return DIRECTION_OF_ROTATION_LABELS[self._direction_of_rotation]
 
     @property
     def steptype(self):
@@ -214,15 +230,12 @@ class StepperMotor(Motor):
     @direction_of_rotation.setter
     def direction_of_rotation(self, direction):
         """Setter for direction of rotation."""
-        if direction == "clockwise":
-            self._direction_of_rotation = True
-            return
-        if direction == "anti-clockwise":
-            self._direction_of_rotation = False
-            return
-        raise ValueError(
-            "That is not a valid option, please choose 'clockwise' or 'anti-clockwise'.",
-        )
+        try:
+            self._direction_of_rotation = DIRECTIONS_OF_ROTATION[direction]
+        except (KeyError, TypeError):
+            raise ValueError(
+                "That is not a valid option, please choose 'clockwise' or 'anti-clockwise'.",
+            )
 
     @steptype.setter
     def steptype(self, steptype):
@@ -232,60 +245,156 @@ class StepperMotor(Motor):
                 "MSX pins are not configured for this motor, "
                 "therefore only full steps are allowed.",
             )
-        valid_steptypes = ["Full", "Half", "1/4", "1/8", "1/16"]
-
-        if steptype not in valid_steptypes:
+        if steptype not in STEPTYPE_MULTIPLIERS:
             raise ValueError(
-                f"That is not a valid step type. Options are {valid_steptypes}",
+                f"That is not a valid step type. Options are {list(STEPTYPE_MULTIPLIERS)}",
             )
         self._steptype = steptype
 
     @step_delay.setter
     def step_delay(self, delay):
-        """Step delay setter."""
-        if not isinstance(delay, int) and not isinstance(delay, float):
+        """Step delay setter. Call persist_delays to save the new value."""
+        if not isinstance(delay, (int, float)):
             raise ValueError("Step delay must be a numeric value in seconds.")
         self._step_delay = float(delay)
-        self.save()
 
     @init_delay.setter
     def init_delay(self, delay):
-        """Init delay setter."""
-        if not isinstance(delay, int) and not isinstance(delay, float):
+        """Init delay setter. Call persist_delays to save the new value."""
+        if not isinstance(delay, (int, float)):
             raise ValueError("Step delay must be a numeric value in seconds.")
         self._init_delay = float(delay)
-        self.save()
+
+    def persist_delays(self):
+        """
+        Save the step and init delays, without touching any other field.
+
+        The delays have no bearing on GPIO pin config, so this skips clean.
+        """
+        self.save(skip_clean=True, update_fields=["_step_delay", "_init_delay"])
 
     # Movement commands
     def move_steps(self, steps: int, log=True):
-        """Move a given number of steps in the set direction."""
+        """
+        Move a given number of steps in the set direction.
+
+        Returns the log of the move, unless log is False, in which case the caller is
+        responsible for logging and nothing is built or returned.
+        """
         if not isinstance(steps, int):
             raise CommandError(f"{steps} is not a valid number of steps.")
 
-        if not self._controller:
+        controller = self._controller
+        if not controller:
             self._init_controller_class()
+            controller = self._controller
 
-        log_info = (
-            f"Moving stepper {self.name} {steps} x {self.steptype} steps "
-            f"in the {self.direction_of_rotation} direction."
-        )
-
-        self._controller.motor_go(
+        steptype = self._steptype
+        controller.motor_go(
             self._direction_of_rotation,
-            self._steptype,
+            steptype,
             steps,
             self._step_delay,
             self._verbose,
             self._init_delay,
         )
-        if log:
-            logging.info(log_info)
+        if not log:
+            return None
 
+        log_info = (
+            f"Moving stepper {self.name} {steps} x {steptype} steps "
+            f"in the {self.direction_of_rotation} direction."
+        )
+        logger.info(log_info)
+        return log_info
+
+    def move_steps_batch(self, moves):
+        """
+        Run a sequence of moves back to back, under a single controller init.
+
+        Each move is a (direction_of_rotation, steptype, steps, step_delay) tuple, taking the
+        same values as the modal settings. The init delay is only applied before the first
+        move. All moves are validated before any are made, and the motor's modal settings
+        are left unchanged. An empty batch does nothing, and returns None.
+        """
+        moves = list(moves)
+        if not moves:
+            return None
+
+        msx_pins_set = self.MS1_GPIO_pin and self.MS2_GPIO_pin and self.MS3_GPIO_pin
+        for move in moves:
+            try:
+                valid_move = len(move) == 4
+            except TypeError:
+                valid_move = False
+            if not valid_move:
+                raise CommandError(f"{move} is not a valid move.")
+
+            direction, steptype, steps, step_delay = move
+            try:
+                valid_direction = direction in DIRECTIONS_OF_ROTATION
+            except TypeError:
+                valid_direction = False
+            if not valid_direction:
+                raise CommandError(f"{direction} is not a valid direction of rotation.")
+            try:
+                valid_steptype = steptype in STEPTYPE_MULTIPLIERS
+            except TypeError:
+                valid_steptype = False
+            if not valid_steptype or (steptype != "Full" and not msx_pins_set):
+                raise CommandError(f"{steptype} is not a valid step type for this motor.")
+            if not isinstance(steps, int):
+                raise CommandError(f"{steps} is not a valid number of steps.")
+            if not isinstance(step_delay, (int, float)):
+                raise CommandError(f"{step_delay} is not a valid step delay.")
+
+        controller = self._controller
+        if not controller:
+            self._init_controller_class()
+            controller = self._controller
+
+        init_delay = self._init_delay
+        for direction, steptype, steps, step_delay in moves:
+            controller.motor_go(
+                DIRECTIONS_OF_ROTATION[direction],
+                steptype,
+                steps,
+                float(step_delay),
+                self._verbose,
+                init_delay,
+            )
+            init_delay = 0.0
+
+        log_info = (
+            f"Moving stepper {self.name} through {len(moves)} moves "
+            f"({sum(move[2] for move in moves)} steps)."
+        )
+        logger.info(log_info)
+        return log_info
+
+    def enqueue(self, command: MotorCommand):
+        """Queue a move, to be run with the rest of the queue by run_queue."""
+        if self._command_queue is None:
+            self._command_queue = []
+        self._command_queue.append(command)
+
+    def run_queue(self):
+        """
+        Run all queued moves as a single batch, then clear the queue.
+
+        If any queued move is invalid, nothing is moved and the queue is kept. Returns None if
+        nothing is queued.
+        """
+        if not self._command_queue:
+            return None
+
+        log_info = self.move_steps_batch(self._command_queue)
+        self._command_queue = None
         return log_info
 
     def move_rotations(self, rotations: [float, int]):
         """Move a given number of rotations or points of a rotation."""
-        if not isinstance(rotations, int) and not isinstance(rotations, float):
+        if not isinstance(rotations, (int, float)):
             raise CommandError(f"{rotations} is not a valid number of rotations.")
 
         # Needs to be a float, but will cause minor inaccuracies.
@@ -299,12 +408,12 @@ class StepperMotor(Motor):
 
         self.move_steps(steps, log=False)
 
-        logging.info(log_info)
+        logger.info(log_info)
         return log_info
 
     def move_mm(self, mm: [float, int]):
         """Move the motor a given number or fraction of a mm."""
-        if not isinstance(mm, int) and not isinstance(mm, float):
+        if not isinstance(mm, (int, float)):
             raise CommandError(f"{mm} is not a valid millimeter measurement.")
         if not self.mm_per_revolution:
             raise ConfigurationError("You have not designated a mm/rev for this motor.")
@@ -319,13 +428,18 @@ class StepperMotor(Motor):
 
         self.move_steps(steps, log=False)
 
-        logging.info(log_info)
+        logger.info(log_info)
         return log_info
 
-    def save(self, **kwargs):
-        """Call clean on save, even from backend."""
-        self.clean()
-        super(StepperMotor, self).save(**kwargs)
+    def save(self, *args, skip_clean=False, **kwargs):
+        """
+        Call clean on save, even from backend.
+
+        Pass skip_clean=True if the instance has already been cleaned, e.g. by a ModelForm.
+        """
+        if not skip_clean:
+            self.clean()
+        super(StepperMotor, self).save(*args, **kwargs)
 
     def __str__(self):
         """String rep for model."""
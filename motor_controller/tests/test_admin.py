@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""Tests for admin.py."""
+
+# Django
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+# Project
+from motor_controller.models import StepperMotor
+from motor_controller.tests.utils import StepperMotorFactory
+
+
+class TestStepperMotorAdmin(TestCase):
+    """Tests for the StepperMotorAdmin."""
+
+    @classmethod
+    def setUpTestData(cls):  # noqa: D102
+        cls.user = User.objects.create_superuser("admin", "admin@example.com", "password")
+        for direction_pin, step_pin in [(2, 17), (3, 18), (4, 27)]:
+            StepperMotorFactory(direction_GPIO_pin=direction_pin, step_GPIO_pin=step_pin)
+
+    def setUp(self) -> None:  # noqa: D102
+        self.client.force_login(self.user)
+
+    def get_description_queries(self, queries):
+        """Return the queries that load a deferred description on its own."""
+        return [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith('SELECT "motor_controller_motor"."description"')
+        ]
+
+    def test_changelist_doesnt_fetch_descriptions(self):
+        """The changelist doesn't show descriptions, so shouldn't select them."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("admin:motor_controller_steppermotor_changelist"))
+        assert response.status_code == 200
+        motor_queries = [
+            query["sql"] for query in queries if '"motor_controller_steppermotor"' in query["sql"]
+        ]
+        assert motor_queries
+        assert not any('"description"' in sql for sql in motor_queries)
+
+    def test_delete_selected_doesnt_fetch_descriptions_per_motor(self):
+        """The delete confirmation renders every motor, which shouldn't cost a query each."""
+        pks = list(StepperMotor.objects.values_list("pk", flat=True))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                reverse("admin:motor_controller_steppermotor_changelist"),
+                {"action": "delete_selected", "_selected_action": pks},
+            )
+        assert response.status_code == 200
+        assert not self.get_description_queries(queries)
+
+    def test_change_view_doesnt_fetch_description_separately(self):
+        """The change form shows the description, so it should be loaded with the motor."""
+        motor = StepperMotor.objects.first()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse("admin:motor_controller_steppermotor_change", args=[motor.pk]),
+            )
+        assert response.status_code == 200
+        assert not self.get_description_queries(queries)
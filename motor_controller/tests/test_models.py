@@ -2,10 +2,12 @@
 """Tests for models.py."""
 
 # Standard Library
+from unittest.mock import call
 from unittest.mock import patch
 
 # Django
 from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase
 from django.test import TestCase
 
 # Project
@@ -13,20 +15,24 @@ from common.constants import AVAILABLE_RPI_GPIO_PINS
 from common.exceptions import CommandError
 from common.exceptions import ConfigurationError
 from common.exceptions import ImplementationError
+from common.utils import check_for_GPIO_pin_use_in_this_and_other_models
 from motor_controller.constants import STEPPER_DRIVER_TYPES
 from motor_controller.models import Motor
+from motor_controller.models import MotorCommand
 from motor_controller.models import StepperMotor
 from motor_controller.tests.utils import StepperMotorFactory
+from switch_controller.constants import PUSH_SWITCH_TYPES
+from switch_controller.models import PushSwitch
 
 
-class TestMotor(TestCase):
+class TestMotor(SimpleTestCase):
     """Tests for the Motor model parent class."""
 
-    def test_gpio_pin_fields_raises_notimplementederror_when_not_subclassed(self):
-        """Property should raise an error if not implemented in concrete subclass."""
+    def test_clean_raises_notimplementederror_when_gpio_pin_fields_not_subclassed(self):
+        """Clean should raise an error if gpio_pin_fields not set in concrete subclass."""
         with self.assertRaises(NotImplementedError) as e:
             motor = Motor()
-            motor.gpio_pin_fields
+            motor.clean()
         assert str(e.exception) == "This needs to be set by the concrete subclass."
 
     # Note that checking for GPIO pin usage cannot be completed in this base model
@@ -34,8 +40,8 @@ class TestMotor(TestCase):
     # TODO - Tests for GPIO pin usage in concrete subclass.
 
 
-class TestStepperMotor(TestCase):
-    """Tests for the StepperMotor class."""
+class BasicStepperMotorMixin:
+    """Sets up the unsaved basic_motor shared by the StepperMotor tests."""
 
     def setUp(self) -> None:  # noqa: D102
         self.basic_motor = StepperMotor(
@@ -45,20 +51,24 @@ class TestStepperMotor(TestCase):
             step_GPIO_pin=26,
         )
 
+
+class TestStepperMotor(BasicStepperMotorMixin, SimpleTestCase):
+    """Tests for the StepperMotor class that don't touch the DB."""
+
     def test_init_params(self):
         """The class should be initialised with the correct params."""
-        motor = StepperMotorFactory()
+        motor = StepperMotorFactory.build()
         assert motor._direction_of_rotation
         assert motor._steptype == "Full"
         assert not motor._verbose
 
-    def test_init_assigns_controller_class_on_init_if_driver_type_is_set(self):
-        """If the instance has a driver type, set the self.controller_class attr."""
+    def test_controller_class_is_set_if_driver_type_is_set(self):
+        """If the instance has a driver type, the controller_class should be resolved."""
         motor = StepperMotor(driver_type=STEPPER_DRIVER_TYPES[0][0])
         assert motor.controller_class == STEPPER_DRIVER_TYPES[0][1]
 
-    def test_init_does_not_assign_controller_class_on_init_if_no_driver_type(self):
-        """If the instance has a driver type, set the self.controller_class attr."""
+    def test_controller_class_is_not_set_if_no_driver_type(self):
+        """If the instance has no driver type, the controller_class should be empty."""
         motor = StepperMotor()
         assert not motor.controller_class
 
@@ -73,60 +83,6 @@ class TestStepperMotor(TestCase):
         assert set(motor.gpio_pin_fields) == set(expected_fields)
         # TODO - Could we not just use this logic for the attr, or would it be circular?
 
-    def test_clean_A4988_errors_if_direction_and_step_pin_not_set(self):
-        """For A4988 drivers, the direction and step pin should be set."""
-        motor = StepperMotor(driver_type="A4988", name="Tester", direction_GPIO_pin=5)
-        with self.assertRaises(ValidationError) as e:
-            motor.clean()
-        assert str(e.exception) == str(
-            {"step_GPIO_pin": ["This field is required for this driver type."]},
-        )
-
-        motor = StepperMotor(driver_type="A4988", name="Tester", step_GPIO_pin=5)
-        with self.assertRaises(ValidationError) as e:
-            motor.clean()
-        assert str(e.exception) == str(
-            {"direction_GPIO_pin": ["This field is required for this driver type."]},
-        )
-
-    def test_clean_A4988_errors_if_not_all_3_MSX_pins_set(self):
-        """For A4988 drivers, all 3 MSX pins should be set or none."""
-        motor = StepperMotor(
-            driver_type="A4988",
-            name="Tester",
-            direction_GPIO_pin=5,
-            step_GPIO_pin=7,
-        )
-        motor.clean()  # Should be fine
-
-        motor = StepperMotor(
-            driver_type="A4988",
-            name="Tester",
-            direction_GPIO_pin=5,
-            step_GPIO_pin=7,
-            MS1_GPIO_pin=16,
-            MS2_GPIO_pin=18,
-            MS3_GPIO_pin=21,
-        )
-        motor.clean()  # Should be fine
-
-        motor = StepperMotor(
-            driver_type="A4988",
-            name="Tester",
-            direction_GPIO_pin=5,
-            step_GPIO_pin=7,
-            MS1_GPIO_pin=13,
-        )
-        with self.assertRaises(ValidationError) as e:
-            motor.clean()
-        assert str(e.exception) == str(
-            {
-                "MS1_GPIO_pin": ["All three of these must be set or none."],
-                "MS2_GPIO_pin": ["All three of these must be set or none."],
-                "MS3_GPIO_pin": ["All three of these must be set or none."],
-            },
-        )
-
     @patch("common.utils.GPIO_PIN_USING_MODELS", ["Something"])
     def test_clean_raises_ImplementationError_if_GPIO_PIN_USING_MODELS_incorrect(self):
         """Clean should error if the models to check are defined incorrectly."""
@@ -154,28 +110,6 @@ class TestStepperMotor(TestCase):
         assert "step_GPIO_pin" in exception_text
         assert "direction_GPIO_pin" in exception_text
 
-    def test_clean_faults_if_same_GPIO_pin_used_twice_in_different_instance(self):
-        """Validationerror should be raised if the same GPIO pin used twice, different instance."""
-        motor1 = StepperMotor.objects.create(
-            driver_type="A4988",
-            name="First Motor",
-            direction_GPIO_pin=5,
-            step_GPIO_pin=7,
-        )
-        motor2 = StepperMotor(
-            driver_type="A4988",
-            name="Second Motor",
-            direction_GPIO_pin=5,
-            step_GPIO_pin=7,
-        )
-
-        with self.assertRaises(ValidationError) as e:
-            motor2.clean()
-        assert (
-            f"This GPIO pin is already in use on {motor1.name}, "
-            f"please select another." in str(e.exception)
-        )
-
     def test_get_controller_class_raises_ConfigurationError_if_no_driver_type(self):
         """Configuration Error should be raised if instance has no driver type."""
         motor1 = StepperMotor(
@@ -190,7 +124,7 @@ class TestStepperMotor(TestCase):
             "model first."
         )
 
-    @patch("motor_controller.models.STEPPER_DRIVER_TYPES", [["A4988", "Tomatos"]])
+    @patch("motor_controller.models.STEPPER_DRIVER_MAP", {"A4988": "Tomatos"})
     def test_get_controller_class_returns_correct_constant(self):
         """Function should return the second constant for given driver type."""
         motor = StepperMotor(
@@ -201,18 +135,29 @@ class TestStepperMotor(TestCase):
         )
         assert motor.get_controller_class() == "Tomatos"
 
-    @patch("motor_controller.models.STEPPER_DRIVER_TYPES", [["A4988"]])
+    @patch("motor_controller.models.STEPPER_DRIVER_MAP", {})
     def test_get_controller_class_returns_raises_error_if_bad_list(self):
         """Function should raise an Implementation error if driver class not set."""
+        motor = StepperMotor(
+            driver_type="A4988",
+            name="First Motor",
+            direction_GPIO_pin=5,
+            step_GPIO_pin=7,
+        )
         with self.assertRaises(ImplementationError) as e:
-            StepperMotor(
-                driver_type="A4988",
-                name="First Motor",
-                direction_GPIO_pin=5,
-                step_GPIO_pin=7,
-            )
+            motor.controller_class
         assert str(e.exception) == "Driver class not set for driver."
 
+    @patch("motor_controller.models.StepperMotor.get_controller_class")
+    def test_controller_class_is_resolved_on_first_use_only(self, mock_get):
+        """Init should not resolve the controller class, first access should, once."""
+        mock_get.return_value = "Tomatos"
+        motor = StepperMotor(driver_type="A4988")
+        mock_get.assert_not_called()
+        assert motor.controller_class == "Tomatos"
+        assert motor.controller_class == "Tomatos"
+        mock_get.assert_called_once()
+
     @patch("motor_controller.models.StepperMotor.get_controller_class")
     def test_init_controller_class_gets_controller_class_if_needed(self, mock_get):
         """Function should get the controller class if not set."""
@@ -373,6 +318,13 @@ class TestStepperMotor(TestCase):
             self.basic_motor.step_delay = items
             assert self.basic_motor._step_delay == float(items)
 
+    @patch("motor_controller.models.StepperMotor.save")
+    def test_delay_setters_do_not_save(self, mock_save):
+        """Setting a delay should not write to the DB until persist_delays is called."""
+        self.basic_motor.step_delay = 1
+        self.basic_motor.init_delay = 2
+        mock_save.assert_not_called()
+
     def test_init_delay_setter_raises_ValueError_if_not_int_or_float(self):
         """Init delay values should be integers or floats only."""
         for items in ["bananas", AssertionError, self.basic_motor]:
@@ -404,17 +356,25 @@ class TestStepperMotor(TestCase):
             self.basic_motor.move_steps(1)
         mock_init.assert_called_once()
 
-    @patch("motor_controller.models.logging")
+    @patch("motor_controller.models.logger")
     @patch("motor_controller.models.A4988Nema")
-    def test_move_steps_logs_move_if_requested(self, mock_nema, mock_logging):
+    def test_move_steps_logs_move_if_requested(self, mock_nema, mock_logger):
         """Function should log the move made if requested or default."""
         self.basic_motor.controller_class = mock_nema
         self.basic_motor.move_steps(1)
-        mock_logging.info.assert_called_once_with(
+        mock_logger.info.assert_called_once_with(
             f"Moving stepper {self.basic_motor.name} 1 x {self.basic_motor.steptype} "
             f"steps in the {self.basic_motor.direction_of_rotation} direction.",
         )
 
+    @patch("motor_controller.models.logger")
+    @patch("motor_controller.models.A4988Nema")
+    def test_move_steps_does_not_log_or_return_log_if_not_requested(self, mock_nema, mock_logger):
+        """Function should leave logging to the caller if log is False."""
+        self.basic_motor.controller_class = mock_nema
+        assert self.basic_motor.move_steps(1, log=False) is None
+        mock_logger.info.assert_not_called()
+
     @patch("motor_controller.models.A4988Nema")
     def test_move_steps_returns_log_info(self, mock_nema):
         """Function should return the text log."""
@@ -439,6 +399,94 @@ class TestStepperMotor(TestCase):
             self.basic_motor.init_delay,
         )
 
+    @patch("motor_controller.models.A4988Nema")
+    def test_move_steps_batch_calls_motor_go_per_move_with_one_init_delay(self, mock_nema):
+        """Function should run each move in turn, only applying the init delay once."""
+        self.basic_motor._controller = mock_nema
+        self.basic_motor.move_steps_batch(
+            [("clockwise", "Full", 10, 0.01), ("anti-clockwise", "Full", 5, 1)],
+        )
+        assert mock_nema.motor_go.call_args_list == [
+            call(True, "Full", 10, 0.01, False, self.basic_motor.init_delay),
+            call(False, "Full", 5, 1.0, False, 0.0),
+        ]
+        assert self.basic_motor.direction_of_rotation == "clockwise"
+
+    @patch("motor_controller.models.A4988Nema")
+    def test_move_steps_batch_validates_all_moves_before_moving(self, mock_nema):
+        """Function should raise a CommandError for a bad move, before making any moves."""
+        self.basic_motor._controller = mock_nema
+        bad_moves = [
+            ("sideways", "Full", 1, 0.01),
+            ("clockwise", "Half", 1, 0.01),
+            ("clockwise", "Full", 1.5, 0.01),
+            ("clockwise", "Full", 1, "bananas"),
+            ("clockwise", "Full", 1),
+            ("clockwise", "Full", 1, 0.01, 0.01),
+            5,
+            (["clockwise"], "Full", 1, 0.01),
+            ("clockwise", {"Full"}, 1, 0.01),
+        ]
+        for bad_move in bad_moves:
+            with self.assertRaises(CommandError):
+                self.basic_motor.move_steps_batch([("clockwise", "Full", 1, 0.01), bad_move])
+        mock_nema.motor_go.assert_not_called()
+
+    @patch("motor_controller.models.logger")
+    @patch("motor_controller.models.StepperMotor._init_controller_class")
+    def test_move_steps_batch_does_nothing_for_no_moves(self, mock_init, mock_logger):
+        """An empty batch shouldn't init the controller, move or log."""
+        self.basic_motor._controller = None
+        assert self.basic_motor.move_steps_batch([]) is None
+        mock_init.assert_not_called()
+        mock_logger.info.assert_not_called()
+
+    @patch("motor_controller.models.A4988Nema")
+    def test_move_steps_batch_returns_log(self, mock_nema):
+        """Function should return a single summary log for the batch."""
+        self.basic_motor.controller_class = mock_nema
+        log = self.basic_motor.move_steps_batch(
+            [("clockwise", "Full", 10, 0.01), ("anti-clockwise", "Full", 5, 0.01)],
+        )
+        assert log == f"Moving stepper {self.basic_motor.name} through 2 moves (15 steps)."
+
+    @patch("motor_controller.models.logger")
+    @patch("motor_controller.models.StepperMotor._init_controller_class")
+    @patch("motor_controller.models.A4988Nema")
+    def test_run_queue_runs_queued_commands_as_a_batch_and_clears_queue(
+        self,
+        mock_nema,
+        mock_init,
+        mock_logger,
+    ):
+        """Queued commands should be run in order on the next run_queue, then forgotten."""
+        self.basic_motor._controller = mock_nema
+        self.basic_motor.enqueue(MotorCommand("clockwise", "Full", 10, 0.01))
+        self.basic_motor.enqueue(MotorCommand("anti-clockwise", "Full", 5, 0.02))
+        self.basic_motor.run_queue()
+        assert mock_nema.motor_go.call_args_list == [
+            call(True, "Full", 10, 0.01, False, self.basic_motor.init_delay),
+            call(False, "Full", 5, 0.02, False, 0.0),
+        ]
+
+        mock_nema.reset_mock()
+        mock_logger.reset_mock()
+        self.basic_motor._controller = None
+        assert self.basic_motor.run_queue() is None
+        mock_nema.motor_go.assert_not_called()
+        mock_init.assert_not_called()
+        mock_logger.info.assert_not_called()
+
+    @patch("motor_controller.models.A4988Nema")
+    def test_run_queue_keeps_queue_if_a_command_is_invalid(self, mock_nema):
+        """An invalid queued command should raise, leaving the queue to be fixed."""
+        self.basic_motor._controller = mock_nema
+        self.basic_motor.enqueue(MotorCommand("sideways", "Full", 10, 0.01))
+        with self.assertRaises(CommandError):
+            self.basic_motor.run_queue()
+        assert self.basic_motor._command_queue == [MotorCommand("sideways", "Full", 10, 0.01)]
+        mock_nema.motor_go.assert_not_called()
+
     @patch("motor_controller.models.A4988Nema")
     def test_move_rotations_raises_CommandError_if_rotations_is_not_int_or_float(self, mock_nema):
         """Move steps command should only take a numeric value."""
@@ -447,13 +495,13 @@ class TestStepperMotor(TestCase):
                 self.basic_motor.move_rotations(items)
             assert str(e.exception) == f"{items} is not a valid number of rotations."
 
-    @patch("motor_controller.models.logging")
+    @patch("motor_controller.models.logger")
     @patch("motor_controller.models.A4988Nema")
-    def test_move_rotations_logs_move_if_requested(self, mock_nema, mock_logging):
+    def test_move_rotations_logs_move_if_requested(self, mock_nema, mock_logger):
         """Function should log the move made."""
         self.basic_motor.controller_class = mock_nema
         self.basic_motor.move_rotations(1)
-        mock_logging.info.assert_called_once_with(
+        mock_logger.info.assert_called_once_with(
             f"Moving stepper {self.basic_motor.name} 1 x rotations (200 steps) "
             f"in the {self.basic_motor.direction_of_rotation} direction.",
         )
@@ -513,14 +561,14 @@ class TestStepperMotor(TestCase):
             self.basic_motor.move_mm(2)
         assert str(e.exception) == "You have not designated a mm/rev for this motor."
 
-    @patch("motor_controller.models.logging")
+    @patch("motor_controller.models.logger")
     @patch("motor_controller.models.A4988Nema")
-    def test_move_mm_logs_move(self, mock_nema, mock_logging):
+    def test_move_mm_logs_move(self, mock_nema, mock_logger):
         """Function should log the move made."""
         self.basic_motor.controller_class = mock_nema
         self.basic_motor.mm_per_revolution = 1
         self.basic_motor.move_mm(1)
-        mock_logging.info.assert_called_once_with(
+        mock_logger.info.assert_called_once_with(
             f"Moving stepper {self.basic_motor.name} 1mm (200 steps) "
             f"in the {self.basic_motor.direction_of_rotation} direction.",
         )
@@ -570,8 +618,212 @@ class TestStepperMotor(TestCase):
             mock_steps.assert_called_once_with(test[4], log=False)
             mock_steps.reset_mock()
 
+
+class TestStepperMotorDB(BasicStepperMotorMixin, TestCase):
+    """Tests for the StepperMotor class that need the DB."""
+
+    def test_clean_A4988_errors_if_direction_and_step_pin_not_set(self):
+        """For A4988 drivers, the direction and step pin should be set."""
+        motor = StepperMotor(driver_type="A4988", name="Tester", direction_GPIO_pin=5)
+        with self.assertRaises(ValidationError) as e:
+            motor.clean()
+        assert e.exception.message_dict == {
+            "step_GPIO_pin": ["This field is required for this driver type."],
+        }
+
+        motor = StepperMotor(driver_type="A4988", name="Tester", step_GPIO_pin=5)
+        with self.assertRaises(ValidationError) as e:
+            motor.clean()
+        assert e.exception.message_dict == {
+            "direction_GPIO_pin": ["This field is required for this driver type."],
+        }
+
+    def test_clean_A4988_errors_if_not_all_3_MSX_pins_set(self):
+        """For A4988 drivers, all 3 MSX pins should be set or none."""
+        motor = StepperMotor(
+            driver_type="A4988",
+            name="Tester",
+            direction_GPIO_pin=5,
+            step_GPIO_pin=7,
+        )
+        motor.clean()  # Should be fine
+
+        motor = StepperMotor(
+            driver_type="A4988",
+            name="Tester",
+            direction_GPIO_pin=5,
+            step_GPIO_pin=7,
+            MS1_GPIO_pin=16,
+            MS2_GPIO_pin=18,
+            MS3_GPIO_pin=21,
+        )
+        motor.clean()  # Should be fine
+
+        motor = StepperMotor(
+            driver_type="A4988",
+            name="Tester",
+            direction_GPIO_pin=5,
+            step_GPIO_pin=7,
+            MS1_GPIO_pin=13,
+        )
+        with self.assertRaises(ValidationError) as e:
+            motor.clean()
+        assert e.exception.message_dict == {
+            "MS1_GPIO_pin": ["All three of these must be set or none."],
+            "MS2_GPIO_pin": ["All three of these must be set or none."],
+            "MS3_GPIO_pin": ["All three of these must be set or none."],
+        }
+
+    def test_clean_faults_if_same_GPIO_pin_used_twice_in_different_instance(self):
+        """Validationerror should be raised if the same GPIO pin used twice, different instance."""
+        motor1 = StepperMotor.objects.create(
+            driver_type="A4988",
+            name="First Motor",
+            direction_GPIO_pin=5,
+            step_GPIO_pin=7,
+        )
+        motor2 = StepperMotor(
+            driver_type="A4988",
+            name="Second Motor",
+            direction_GPIO_pin=5,
+            step_GPIO_pin=7,
+        )
+
+        # The clash is on the first model searched, so no other model should be queried.
+        with self.assertRaises(ValidationError) as e, self.assertNumQueries(1):
+            motor2.clean()
+        assert (
+            f"This GPIO pin is already in use on {motor1.name}, "
+            f"please select another." in str(e.exception)
+        )
+
+    def test_clean_reports_the_clashing_GPIO_pin_field(self):
+        """The ValidationError should be keyed on the field that holds the clashing pin."""
+        StepperMotor.objects.create(
+            driver_type="A4988",
+            name="First Motor",
+            direction_GPIO_pin=5,
+            step_GPIO_pin=7,
+        )
+        motor2 = StepperMotor(
+            driver_type="A4988",
+            name="Second Motor",
+            direction_GPIO_pin=9,
+            step_GPIO_pin=7,
+        )
+
+        with self.assertRaises(ValidationError) as e:
+            motor2.clean()
+        assert e.exception.message_dict == {
+            "step_GPIO_pin": [
+                "This GPIO pin is already in use on First Motor, please select another.",
+            ],
+        }
+
+    def test_clean_faults_if_GPIO_pin_used_on_other_model_with_same_pk(self):
+        """Validationerror should be raised for a clash on another model sharing this pk."""
+        PushSwitch.objects.create(
+            id=50,
+            name="Switch",
+            switch_type=PUSH_SWITCH_TYPES[0][0],
+            input_GPIO_pin=self.basic_motor.step_GPIO_pin,
+        )
+        self.basic_motor.pk = 50
+
+        with self.assertRaises(ValidationError) as e:
+            self.basic_motor.clean()
+        assert e.exception.message_dict == {
+            "step_GPIO_pin": ["This GPIO pin is already in use on Switch, please select another."],
+        }
+
+    def test_clean_keys_cross_model_GPIO_clash_on_field_for_string_pins(self):
+        """Pins set as strings should still have their clash reported on the right field."""
+        PushSwitch.objects.create(
+            name="Switch",
+            switch_type=PUSH_SWITCH_TYPES[0][0],
+            input_GPIO_pin=5,
+        )
+        motor = StepperMotor(name="String Pins", direction_GPIO_pin="5", step_GPIO_pin="7")
+
+        with self.assertRaises(ValidationError) as e:
+            motor.save()
+        assert e.exception.message_dict == {
+            "direction_GPIO_pin": [
+                "This GPIO pin is already in use on Switch, please select another.",
+            ],
+        }
+
+    def test_cross_model_GPIO_check_skipped_if_no_pins_set(self):
+        """With no pins to clash, no models should be searched."""
+        motor = StepperMotor(name="Unconfigured Motor")
+        with self.assertNumQueries(0):
+            check_for_GPIO_pin_use_in_this_and_other_models(motor)
+
+    def test_clean_checks_loaded_motor_against_pins_taken_since_it_was_saved(self):
+        """A reloaded motor should still clash with pins other rows took without clean."""
+        motor = StepperMotorFactory(direction_GPIO_pin=5, step_GPIO_pin=7)
+        # PushSwitch.save doesn't call clean, so nothing stops this pin being reused.
+        PushSwitch.objects.create(
+            name="Switch",
+            switch_type=PUSH_SWITCH_TYPES[0][0],
+            input_GPIO_pin=5,
+        )
+
+        motor = StepperMotor.objects.get(pk=motor.pk)
+        motor.name = "Renamed"
+        with self.assertRaises(ValidationError) as e:
+            motor.save()
+        assert e.exception.message_dict == {
+            "direction_GPIO_pin": [
+                "This GPIO pin is already in use on Switch, please select another.",
+            ],
+        }
+
+    def test_clean_checks_GPIO_pin_use_with_one_query_per_model(self):
+        """Cross model GPIO pin checks should not scale with the number of pin fields."""
+        self.basic_motor.MS1_GPIO_pin = 1
+        self.basic_motor.MS2_GPIO_pin = 2
+        self.basic_motor.MS3_GPIO_pin = 3
+        with self.assertNumQueries(2):
+            self.basic_motor.clean()
+
+    @patch("common.utils.apps.get_model")
+    def test_clean_uses_cached_GPIO_pin_using_models(self, mock_get_model):
+        """The GPIO pin using models are resolved on app load, not on every clean."""
+        self.basic_motor.clean()
+        mock_get_model.assert_not_called()
+
+    def test_persist_delays_saves_only_delays(self):
+        """Function should save the delays, without cleaning or saving other fields."""
+        motor = StepperMotorFactory()
+        motor.step_delay = 1
+        motor.init_delay = 2
+        motor.name = "Not saved"
+        with patch("motor_controller.models.StepperMotor.clean") as mock_clean:
+            motor.persist_delays()
+        mock_clean.assert_not_called()
+
+        motor.refresh_from_db()
+        assert motor.step_delay == 1.0
+        assert motor.init_delay == 2.0
+        assert motor.name != "Not saved"
+
     @patch("motor_controller.models.StepperMotor.clean")
     def test_save_calls_clean_method(self, mock_clean):
         """Saving the model should call clean."""
         self.basic_motor.save()
         mock_clean.assert_called_once()
+
+    @patch("motor_controller.models.StepperMotor.clean")
+    def test_save_skips_clean_method_if_requested(self, mock_clean):
+        """Saving the model with skip_clean should not call clean again."""
+        self.basic_motor.save(skip_clean=True)
+        mock_clean.assert_not_called()
+
+    @patch("motor_controller.models.StepperMotor.clean")
+    def test_save_passes_positional_args_on_without_skipping_clean(self, mock_clean):
+        """Positional args are Django's save args, so shouldn't be taken as skip_clean."""
+        motor = StepperMotor(name="New Motor", direction_GPIO_pin=5, step_GPIO_pin=7)
+        motor.save(True)
+        mock_clean.assert_called_once()
+        assert StepperMotor.objects.filter(pk=motor.pk).exists()
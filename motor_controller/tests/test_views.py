@@ -27,10 +27,13 @@ from motor_controller.views import stepper_motor_modal_ajax_view
 class TestMoveStepperMotorAJAXView(TestCase):
     """Tests for the move_stepper_motor_ajax_view."""
 
+    @classmethod
+    def setUpTestData(cls):  # noqa: D102
+        cls.motor = StepperMotorFactory()
+
     def setUp(self) -> None:  # noqa: D102
         self.factory = RequestFactory()
         self.view = move_stepper_motor_ajax_view
-        self.motor = StepperMotorFactory()
 
     def test_no_motor_found_gives_400_error(self):
         """If a motor cannot be found, return 400 and error message."""
@@ -56,6 +59,22 @@ class TestMoveStepperMotorAJAXView(TestCase):
             "error": "The specified movement type does not exist.",
         }
 
+    def test_non_movement_method_gives_400_error(self):
+        """Only movement methods can be called, not any other method of the motor."""
+        payload = {
+            "motor_id": self.motor.id,
+            "movement_type": "delete",
+            "movement_amount": 123,
+        }
+        request = self.factory.post("/", data=json.dumps(payload), content_type="application/json")
+
+        response = self.view(request, motor_id=self.motor.id)
+        assert response.status_code == BAD_REQUEST
+        assert json.loads(response.content) == {
+            "error": "The specified movement type does not exist.",
+        }
+        assert StepperMotor.objects.filter(id=self.motor.id).exists()
+
     @patch("motor_controller.models.StepperMotor.move_mm")
     def test_correct_payload_calls_correct_movement_function_and_returns_log_as_JSON(
         self,
@@ -79,19 +98,17 @@ class TestMoveStepperMotorAJAXView(TestCase):
     @patch("motor_controller.models.StepperMotor.move_mm")
     def test_command_error_and_configuration_error_return_error_as_json(self, mock_move_mm):
         """If a CommandError or ConfigurationError occur, send the error text back as JSON."""
-        payload = {
-            "motor_id": self.motor.id,
-            "movement_type": "move_mm",
-            "movement_amount": 123,
-        }
+        payload = json.dumps(
+            {
+                "motor_id": self.motor.id,
+                "movement_type": "move_mm",
+                "movement_amount": 123,
+            },
+        )
         for effect in [CommandError, ConfigurationError]:
             mock_move_mm.reset_mock()
             mock_move_mm.side_effect = effect("Error occurred!")
-            request = self.factory.post(
-                "/",
-                data=json.dumps(payload),
-                content_type="application/json",
-            )
+            request = self.factory.post("/", data=payload, content_type="application/json")
             response = self.view(request, motor_id=self.motor.id)
             mock_move_mm.assert_called_once_with(123)
             assert response.status_code == NOT_IMPLEMENTED
@@ -101,10 +118,13 @@ class TestMoveStepperMotorAJAXView(TestCase):
 class TestStepperMotorModalAJAXView(TestCase):
     """Tests for the stepper_motor_modal_ajax_view."""
 
+    @classmethod
+    def setUpTestData(cls):  # noqa: D102
+        cls.motor = StepperMotorFactory()
+
     def setUp(self) -> None:  # noqa: D102
         self.factory = RequestFactory()
         self.view = stepper_motor_modal_ajax_view
-        self.motor = StepperMotorFactory()
 
     def test_no_property_or_value_in_json_raises_400_error(self):
         """A malformed request raises a 400 error."""
@@ -173,20 +193,18 @@ class TestStepperMotorModalAJAXView(TestCase):
         """If a CommandError or ImplementationError occur, send the error text back as JSON."""
         setter_mock = Mock(wraps=StepperMotor.step_delay.fset)
         mock_property = StepperMotor.step_delay.setter(setter_mock)
+        payload = json.dumps(
+            {
+                "motor_id": self.motor.id,
+                "property": "step_delay",
+                "value": 123,
+            },
+        )
         with patch.object(StepperMotor, "step_delay", mock_property):
             for effect in [CommandError, ImplementationError]:
-                payload = {
-                    "motor_id": self.motor.id,
-                    "property": "step_delay",
-                    "value": 123,
-                }
                 setter_mock.reset_mock()
                 setter_mock.side_effect = effect("Error occurred!")
-                request = self.factory.post(
-                    "/",
-                    data=json.dumps(payload),
-                    content_type="application/json",
-                )
+                request = self.factory.post("/", data=payload, content_type="application/json")
                 response = self.view(request, motor_id=self.motor.id)
                 setter_mock.assert_called_once_with(self.motor, 123)
                 assert response.status_code == NOT_IMPLEMENTED
@@ -215,10 +233,13 @@ class TestStepperMotorModalAJAXView(TestCase):
 class TestStepperMotorBasicControlView(TestCase):
     """Tests for stepper_motor_basic_control_view."""
 
+    @classmethod
+    def setUpTestData(cls):  # noqa: D102
+        cls.motor = StepperMotorFactory()
+
     def setUp(self) -> None:  # noqa: D102
         self.factory = RequestFactory()
         self.view = stepper_motor_basic_control_view
-        self.motor = StepperMotorFactory()
 
     def test_context(self):
         """Test for correct context items."""
@@ -231,3 +252,9 @@ class TestStepperMotorBasicControlView(TestCase):
         ]
 
         self.assertTemplateUsed("stepper_motor_basic_control_view.html")
+
+    def test_motor_list_renders_in_one_query(self):
+        """Rendering the motor list shouldn't load any deferred fields per motor."""
+        StepperMotorFactory(direction_GPIO_pin=5, step_GPIO_pin=7)
+        with self.assertNumQueries(1):
+            self.client.get(reverse(self.view))
@@ -3,19 +3,18 @@
 
 # Standard Library
 import json
+from http import HTTPStatus
 
 # Django
 from django.http import JsonResponse
 from django.shortcuts import render  # noqa: F401
 from django.views.decorators.http import require_POST
 
-# 3rd-party
-from rest_framework import status
-
 # Project
 from common.exceptions import CommandError
 from common.exceptions import ConfigurationError
 from common.exceptions import ImplementationError
+from motor_controller.constants import STEPPER_MOVEMENT_TYPES
 from motor_controller.models import StepperMotor
 
 
@@ -34,27 +33,28 @@ def move_stepper_motor_ajax_view(request, motor_id):
     data = json.loads(request.body)
 
     try:
-        motor = StepperMotor.objects.get(id=motor_id)
+        # Moves never read the description, so don't fetch it.
+        motor = StepperMotor.objects.defer("description").get(id=motor_id)
     except StepperMotor.DoesNotExist:
         return JsonResponse(
             {"error": "The specified motor does not exist."},
-            status=status.HTTP_400_BAD_REQUEST,
+            status=HTTPStatus.BAD_REQUEST,
         )
 
-    try:
-        move_function = getattr(motor, data["movement_type"])
-    except AttributeError:
+    # Only dispatch to movement methods, never to any other attribute of the motor.
+    movement_type = data.get("movement_type")
+    if movement_type not in STEPPER_MOVEMENT_TYPES:
         return JsonResponse(
             {"error": "The specified movement type does not exist."},
-            status=status.HTTP_400_BAD_REQUEST,
+            status=HTTPStatus.BAD_REQUEST,
         )
 
     try:
-        log = move_function(data["movement_amount"])
+        log = getattr(motor, movement_type)(data["movement_amount"])
     except (CommandError, ConfigurationError) as e:
-        return JsonResponse({"error": str(e)}, status=status.HTTP_501_NOT_IMPLEMENTED)
+        return JsonResponse({"error": str(e)}, status=HTTPStatus.NOT_IMPLEMENTED)
 
-    return JsonResponse({"log": log}, status=status.HTTP_200_OK)
+    return JsonResponse({"log": log}, status=HTTPStatus.OK)
 
 
 @require_POST
@@ -71,30 +71,32 @@ def stepper_motor_modal_ajax_view(request, motor_id):
         value = data["value"]
     except KeyError:
         response = {"error": "You did not provide a property or value key."}
-        return JsonResponse(response, status=status.HTTP_400_BAD_REQUEST)
+        return JsonResponse(response, status=HTTPStatus.BAD_REQUEST)
 
     try:
         motor = StepperMotor.objects.get(id=motor_id)
     except StepperMotor.DoesNotExist:
         response = {"error": "The specified motor does not exist."}
-        return JsonResponse(response, status=status.HTTP_400_BAD_REQUEST)
+        return JsonResponse(response, status=HTTPStatus.BAD_REQUEST)
 
-    if attr[:1] == "_":
+    if attr.startswith("_"):
         response = {"error": "You cannot set protected attributes with this API."}
-        return JsonResponse(response, status=status.HTTP_400_BAD_REQUEST)
+        return JsonResponse(response, status=HTTPStatus.BAD_REQUEST)
 
     try:
         getattr(motor, attr)
         setattr(motor, attr, value)
+        if attr in ("step_delay", "init_delay"):
+            motor.persist_delays()
     except AttributeError:
         response = {"error": "Could not set this attribute, does not exist."}
-        return JsonResponse(response, status=status.HTTP_400_BAD_REQUEST)
+        return JsonResponse(response, status=HTTPStatus.BAD_REQUEST)
     except (CommandError, ImplementationError) as e:
         response = {"error": f"Could not set this attribute, error {e}."}
-        return JsonResponse(response, status=status.HTTP_501_NOT_IMPLEMENTED)
+        return JsonResponse(response, status=HTTPStatus.NOT_IMPLEMENTED)
 
     response = {"log": f"Attribute set successfully, new value {getattr(motor, attr)}"}
-    return JsonResponse(response, status=status.HTTP_200_OK)
+    return JsonResponse(response, status=HTTPStatus.OK)
 
 
 def stepper_motor_basic_control_view(request):
@@ -104,7 +106,8 @@ def stepper_motor_basic_control_view(request):
     This doesn't do much apart from basic GET as all commands are posted to move_stepper_ajax_view.
     """
     context = {
-        "stepper_motors": StepperMotor.objects.all(),
-        "movement_types": ["move_mm", "move_steps", "move_rotations"],
+        # The motor list only shows each motor's id, name and description.
+        "stepper_motors": StepperMotor.objects.only("name", "description"),
+        "movement_types": list(STEPPER_MOVEMENT_TYPES),
     }
     return render(request, "stepper_motor_basic_control_view.html", context)
@@ -12,21 +12,22 @@ from setuptools import setup
 
 def get_version(package):
     """Return package version as listed in `__version__` in `init.py`."""
-    init_py = open(os.path.join(package, "__init__.py")).read()
+    with open(os.path.join(package, "__init__.py")) as f:
+        init_py = f.read()
     return re.search("__version__ = ['\"]([^'\"]+)['\"]", init_py).group(1)
 
 
 def read(fname):
     """Read text file content and return it."""
-    return open(os.path.join(os.path.dirname(__file__), fname)).read()
+    with open(os.path.join(os.path.dirname(__file__), fname)) as f:
+        return f.read()
 
 
 # TODO - This is super over egging it. Slim down.
 def requirements_as_list():
+    """Return the lines of requirements.txt."""
     with open("requirements.txt") as f:
-        required = f.read().splitlines()
-        print(required)
-    return required
+        return f.read().splitlines()
 
 
 version = get_version("motor_controller")
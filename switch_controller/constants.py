@@ -3,7 +3,7 @@
 
 # Project
 
-PUSH_SWITCH_TYPES = [
+PUSH_SWITCH_TYPES = (
     ("PTM", "Push To Make"),
     ("PTB", "Push To Break"),
-]
+)
@@ -9,8 +9,7 @@ from django.db import models
 # Project
 from common.constants import AVAILABLE_RPI_GPIO_PINS
 from common.constants import RPI_GPIO_MODE
-from common.utils import check_for_GPIO_pin_use_in_this_and_other_models
-from common.utils import check_for_GPIO_pin_use_in_this_instance
+from common.utils import check_for_GPIO_pin_use
 from switch_controller.constants import PUSH_SWITCH_TYPES
 
 # Conditional GPIO import for non Pi machine testing purposes
@@ -41,16 +40,11 @@ class PushSwitch(Switch):
         self.initialised = False
         super().__init__(*args, **kwargs)
 
-    @property
-    def gpio_pin_fields(self):
-        """All fields housing GPIO pin config in this model."""
-        return [
-            "input_GPIO_pin",
-        ]
+    # All fields housing GPIO pin config in this model.
+    gpio_pin_fields = ("input_GPIO_pin",)
 
     def clean(self):  # noqa: D102
-        check_for_GPIO_pin_use_in_this_instance(self)
-        check_for_GPIO_pin_use_in_this_and_other_models(self)
+        check_for_GPIO_pin_use(self)
         super(PushSwitch, self).clean()
 
     def initialise(self):
@@ -10,6 +10,7 @@ from unittest.mock import patch
 
 # Django
 from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase
 from django.test import TestCase
 
 # Project
@@ -31,7 +32,7 @@ except ImportError:
 from switch_controller.tests.utils import PushSwitchFactory
 
 
-class TestPushSwitch(TestCase):
+class TestPushSwitch(SimpleTestCase):
     """
     Tests for the PushSwitch model.
 
@@ -40,7 +41,7 @@ class TestPushSwitch(TestCase):
     """
 
     def setUp(self) -> None:  # noqa: D102
-        self.switch = PushSwitchFactory()
+        self.switch = PushSwitchFactory.build()
 
     def test_push_switch_type_choices(self):
         """Should only be able to save the type as one of the choices."""
@@ -50,7 +51,7 @@ class TestPushSwitch(TestCase):
                 switch_type="Barry",
                 input_GPIO_pin=AVAILABLE_RPI_GPIO_PINS[0][0],
             )
-            switch.full_clean()
+            switch.clean_fields()
 
     def test_gpio_pin_valid_choice(self):
         """Should only be able to save the GPIO pin as one of the correct pins."""
@@ -60,37 +61,18 @@ class TestPushSwitch(TestCase):
                 switch_type=PUSH_SWITCH_TYPES[0][0],
                 input_GPIO_pin=99999,
             )
-            switch.full_clean()
+            switch.clean_fields()
 
-    @patch("common.utils.GPIO_PIN_USING_MODELS", ["Something"])
     def test_clean_raises_ImplementationError_if_GPIO_PIN_USING_MODELS_incorrect(self):
         """Clean should error if the models to check are defined incorrectly."""
-        with self.assertRaises(ImplementationError) as e:
-            self.switch.clean()
-        assert (
-            str(e.exception) == "The format for defining models is '<app_name>.<model_name>', you "
-            "defined Something."
-        )
-
-    def test_clean_faults_if_same_GPIO_pin_used_twice_in_different_instance(self):
-        """Validationrror should be raised if the same GPIO pin used twice, different instance."""
-        switch1 = PushSwitch.objects.create(
-            name="First Switch",
-            switch_type=PUSH_SWITCH_TYPES[0][0],
-            input_GPIO_pin=5,
-        )
-        switch2 = PushSwitch(
-            name="Second Switch",
-            switch_type=PUSH_SWITCH_TYPES[0][0],
-            input_GPIO_pin=5,
-        )
-
-        with self.assertRaises(ValidationError) as e:
-            switch2.clean()
-        assert (
-            f"This GPIO pin is already in use on {switch1.name}, "
-            f"please select another." in str(e.exception)
-        )
+        for modelstr in ["Something", "", "switch_controller.PushSwitch.extra"]:
+            with patch("common.utils.GPIO_PIN_USING_MODELS", [modelstr]):
+                with self.assertRaises(ImplementationError) as e:
+                    self.switch.clean()
+            assert (
+                str(e.exception) == "The format for defining models is "
+                f"'<app_name>.<model_name>', you defined {modelstr}."
+            )
 
     @patch("switch_controller.models.GPIO")
     def test_initialise_initialises_GPIO_pin(self, GPIO_mock):
@@ -186,3 +168,27 @@ class TestPushSwitch(TestCase):
         """Property should call cleanup."""
         self.switch.kill()
         GPIO_mock.cleanup.assert_called_once()
+
+
+class TestPushSwitchDB(TestCase):
+    """Tests for the PushSwitch model that need the DB."""
+
+    def test_clean_faults_if_same_GPIO_pin_used_twice_in_different_instance(self):
+        """Validationrror should be raised if the same GPIO pin used twice, different instance."""
+        switch1 = PushSwitch.objects.create(
+            name="First Switch",
+            switch_type=PUSH_SWITCH_TYPES[0][0],
+            input_GPIO_pin=5,
+        )
+        switch2 = PushSwitch(
+            name="Second Switch",
+            switch_type=PUSH_SWITCH_TYPES[0][0],
+            input_GPIO_pin=5,
+        )
+
+        with self.assertRaises(ValidationError) as e:
+            switch2.clean()
+        assert (
+            f"This GPIO pin is already in use on {switch1.name}, "
+            f"please select another." in str(e.exception)
+        )